@@ -0,0 +1,91 @@
+"""
+Shared pytest fixtures for the File System Analyzer test suite
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from file_analyzer import FileSystemAnalyzer, parse_size
+
+
+# exercise the size parser and the signature/extension paths once at
+# collection time, so each xdist worker pays first-call costs up front
+# rather than inside whichever test happens to run first; paranoid mode,
+# since this file's trusted .py extension would otherwise skip the header read
+parse_size('1K')
+FileSystemAnalyzer(os.path.dirname(__file__), paranoid_signatures=True).get_file_category(Path(__file__))
+
+
+KB_ZEROS = b'\x00' * 1000
+
+# realistic project layout used by the integration tests
+INTEGRATION_STRUCTURE = {
+    'project/src/main.py': b'print("Hello")\n',
+    'project/src/utils.py': b'def helper():\n    pass\n',
+    'project/docs/README.md': b'# Project Documentation\n',
+    'project/docs/manual.pdf': b'%PDF-1.4\n%fake pdf content',
+    'project/images/logo.png': b'\x89PNG\r\n\x1a\n' + KB_ZEROS,
+    'project/data/large_dataset.csv': b'col1,col2,col3\n',
+    'project/config/settings.ini': b'[section]\nkey=value\n',
+    'project/build/app.exe': b'MZ\x90\x00' + KB_ZEROS,
+}
+
+# files extended to a logical size after their content is written; the
+# analyzer only stats them, so sparse padding is indistinguishable from data
+INTEGRATION_PADDED_SIZES = {
+    'project/data/large_dataset.csv': 600000,
+}
+
+
+@pytest.fixture(scope="module")
+def shared_analyzer(tmp_path_factory):
+    """Extension-only analyzer instance reused by the analyzer fixture"""
+    return FileSystemAnalyzer(str(tmp_path_factory.mktemp("shared")), use_signatures=False)
+
+
+@pytest.fixture
+def analyzer(shared_analyzer, tmp_path):
+    """Shared analyzer, reset and pointed at the per-test temporary directory"""
+    shared_analyzer.reset()
+    shared_analyzer.directory = tmp_path
+    return shared_analyzer
+
+
+@pytest.fixture(scope="class")
+def analyzer_factory(tmp_path_factory):
+    """Build (analyzer, directory) pairs with custom options in fresh directories"""
+    def _make(**kwargs):
+        directory = tmp_path_factory.mktemp("a")
+        return FileSystemAnalyzer(str(directory), **kwargs), directory
+    return _make
+
+
+@pytest.fixture(scope="module")
+def ro_analyzer(tmp_path_factory):
+    """Signature-enabled analyzer and its directory, shared by read-only tests
+
+    Tests using it must not run an analysis and must write unique filenames.
+    """
+    directory = tmp_path_factory.mktemp("ro")
+    return FileSystemAnalyzer(str(directory), use_signatures=True), directory
+
+
+@pytest.fixture(scope="session")
+def integration_tree(tmp_path_factory):
+    """(root, structure) of a project tree built once per session
+
+    Tests must treat the tree as read-only; structure maps each file's path
+    relative to root to its content, so tests need not import this module.
+    """
+    root = tmp_path_factory.mktemp("proj")
+    # most files share a parent, so create each directory only once
+    for directory in {(root / filepath).parent for filepath in INTEGRATION_STRUCTURE}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for filepath, content in INTEGRATION_STRUCTURE.items():
+        path = root / filepath
+        path.write_bytes(content)
+        if filepath in INTEGRATION_PADDED_SIZES:
+            os.truncate(path, INTEGRATION_PADDED_SIZES[filepath])
+    return root, INTEGRATION_STRUCTURE
@@ -14,34 +14,84 @@ if sys.version_info < (3, 10):
     print(f"Current version: {sys.version}")
     sys.exit(1)
 
+import errno
+import heapq
 import stat
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Set
-from enum import Enum
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Tuple, Optional, Set, TypeVar, Union
+from enum import IntEnum
 
-class FileCategory(Enum):
+T = TypeVar('T')
+
+# default worker threads for the CLI; the walk is bound by metadata syscalls
+# rather than CPU, so oversubscribe the cores (capped like ThreadPoolExecutor)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+class FileCategory(IntEnum):
     """File categories for classification"""
-    TEXT = 'text'
-    IMAGE = 'image'
-    EXECUTABLE = 'executable'
-    ARCHIVE = 'archive'
-    DOCUMENT = 'document'
-    VIDEO = 'video'
-    AUDIO = 'audio'
-    CONFIG = 'config'
-    APPLICATION = 'application'
-    OTHER = 'other'
+    # dense values from 0, so per-category totals can live in plain lists
+    TEXT = 0
+    IMAGE = 1
+    EXECUTABLE = 2
+    ARCHIVE = 3
+    DOCUMENT = 4
+    VIDEO = 5
+    AUDIO = 6
+    CONFIG = 7
+    APPLICATION = 8
+    OTHER = 9
+
+StrPath = Union[str, 'os.PathLike[str]']
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a single file"""
-    path: Path
+    # plain string as produced by os.scandir; a Path per file is a measurable
+    # cost on large trees
+    path: str
     size: int
     category: FileCategory
     permissions_issue: Optional[str] = None
 
+# header reads skip Python's buffered IO; O_NOATIME (Linux only) avoids dirtying
+# each scanned inode with an access-time update
+_HEADER_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# bytes read from the start of a file for signature and text detection
+_HEADER_LENGTH = 32
+
+# maps printable ASCII, tab, newline and carriage return to 0, all else to 1
+_NONTEXT_TABLE = bytes(0 if 32 <= b < 127 or b in (9, 10, 13) else 1 for b in range(256))
+
+def _suffix(name: str) -> str:
+    """Lowercased extension of a file name, with os.path.splitext semantics"""
+    i = name.rfind('.')
+    # leading dots do not start an extension (".bashrc" has none)
+    if i <= 0 or (name[0] == '.' and not name[:i].lstrip('.')):
+        return ''
+    return name[i:].lower()
+
+def _batched(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def _index_by_first_byte(
+    signatures: Dict[bytes, FileCategory]
+) -> Dict[int, Tuple[Tuple[bytes, FileCategory], ...]]:
+    """Group signatures by their first byte, preserving declaration order"""
+    index: Dict[int, List[Tuple[bytes, FileCategory]]] = defaultdict(list)
+    for signature, category in signatures.items():
+        index[signature[0]].append((signature, category))
+    return {first_byte: tuple(candidates) for first_byte, candidates in index.items()}
+
 class FileSystemAnalyzer:
     """Analyzes file system structure and reports statistics"""
     
@@ -125,72 +175,116 @@ class FileSystemAnalyzer:
         b'fLaC': FileCategory.AUDIO,  # FLAC
     }
     
+    # extensions used for arbitrary binary payloads; these are still sniffed
+    AMBIGUOUS_EXTENSIONS: Set[str] = {'.bin', '.dat'}
+    
+    # extensions whose category is taken as-is, without reading the file
+    _TRUSTED_EXTENSIONS = frozenset(EXTENSION_MAP.keys() - AMBIGUOUS_EXTENSIONS)
+    
+    # signatures are anchored at offset 0, so only those sharing the header's
+    # first byte can match (at most three per byte)
+    _SIGNATURES_BY_FIRST_BYTE = _index_by_first_byte(FILE_SIGNATURES)
+    
     # extensions that should not be executable
     SUSPICIOUS_EXECUTABLE_EXTENSIONS: Set[str] = {'.txt', '.log', '.conf', '.cfg', '.ini'}
     
-    def __init__(self, directory: str, size_threshold: int = 1024*1024, use_signatures: bool = True, max_large_files: int = 10):
+    # entries stat'ed together, and handed to a worker thread at a time
+    BATCH_SIZE = 64
+    
+    def __init__(self, directory: str, size_threshold: int = 1024*1024, use_signatures: bool = True, max_large_files: int = 10,
+                 jobs: int = 1, paranoid_signatures: bool = False):
         self.directory = Path(directory)
         self.size_threshold = size_threshold
         self.use_signatures = use_signatures
         self.max_large_files = max_large_files
-        
-        # results storage
-        self.files_by_category: Dict[FileCategory, List[FileInfo]] = defaultdict(list)
-        self.category_sizes: Dict[FileCategory, int] = defaultdict(int)
-        self.large_files: List[FileInfo] = []
-        self.permission_issues: List[FileInfo] = []
+        self.jobs = jobs
+        self.paranoid_signatures = paranoid_signatures
+        self._header_open_flags = _HEADER_OPEN_FLAGS | _O_NOATIME
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear accumulated results so the analyzer can be reused"""
+        # indexed by FileCategory
+        self.category_counts: List[int] = [0] * len(FileCategory)
+        self.category_sizes: List[int] = [0] * len(FileCategory)
+        # min-heap of (size, path) holding the max_large_files largest files
+        self.large_files: List[Tuple[int, str]] = []
+        self.large_file_count = 0
+        # (path, issue) pairs; plain tuples rather than retained FileInfo objects
+        self.permission_issues: List[Tuple[str, str]] = []
         self.total_files = 0
         self.total_size = 0
-        self.errors: List[Tuple[Path, str]] = []
+        self.errors: List[Tuple[str, str]] = []
     
-    def detect_file_signature(self, file_path: Path) -> Optional[FileCategory]:
-        """Detect file type using magic bytes/file signatures"""
+    def detect_file_signature(self, file_path: StrPath, size: Optional[int] = None) -> Optional[FileCategory]:
+        """Detect file type using magic bytes/file signatures
+
+        When the file's size is already known, no more than size bytes are
+        requested. A size of 0 is treated as unknown: procfs files report it
+        despite having content.
+        """
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(32)
-                
-                if not header:
-                    return None
-                
-                # check signatures first
-                for signature, category in self.FILE_SIGNATURES.items():
-                    if header.startswith(signature):
-                        # special case for RIFF files
-                        if signature == b'RIFF' and len(header) >= 12:
-                            match header[8:12]:
-                                case b'WAVE':
-                                    return FileCategory.AUDIO
-                                case b'AVI ':
-                                    return FileCategory.VIDEO
-                        return category
-                
-                # check for MP4 variants (ftyp box at offset 4)
-                if len(header) >= 12 and header[4:8] == b'ftyp':
-                    match header[8:12]:
-                        case b'mp41' | b'mp42' | b'isom' | b'f4v ' | b'F4V ':
-                            return FileCategory.VIDEO
-                        case b'M4V ':
-                            return FileCategory.VIDEO
-                        case b'M4A ':
-                            return FileCategory.AUDIO
+            header = self._read_header(file_path, min(size, _HEADER_LENGTH) if size else _HEADER_LENGTH)
+            
+            if not header:
+                return None
+            
+            # check signatures first
+            for signature, category in self._SIGNATURES_BY_FIRST_BYTE.get(header[0], ()):
+                if header.startswith(signature):
+                    # special case for RIFF files
+                    if signature == b'RIFF' and len(header) >= 12:
+                        match header[8:12]:
+                            case b'WAVE':
+                                return FileCategory.AUDIO
+                            case b'AVI ':
+                                return FileCategory.VIDEO
+                    return category
+            
+            # check for MP4 variants (ftyp box at offset 4)
+            if len(header) >= 12 and header[4:8] == b'ftyp':
+                match header[8:12]:
+                    case b'mp41' | b'mp42' | b'isom' | b'f4v ' | b'F4V ':
+                        return FileCategory.VIDEO
+                    case b'M4V ':
+                        return FileCategory.VIDEO
+                    case b'M4A ':
+                        return FileCategory.AUDIO
+            
+            # check for text files
+            if self._is_text_content(header):
+                return FileCategory.TEXT
                 
-                # check for text files
-                if self._is_text_content(header):
-                    return FileCategory.TEXT
-                    
         except (OSError, PermissionError):
             pass
         
         return None
     
+    def _read_header(self, file_path: StrPath, length: int = _HEADER_LENGTH) -> bytes:
+        """Read the first bytes of a file with a raw, unbuffered descriptor"""
+        # decide on the flags this call used; another worker thread may have
+        # already dropped O_NOATIME from the shared attribute
+        flags = self._header_open_flags
+        try:
+            fd = os.open(file_path, flags)
+        except PermissionError as e:
+            # O_NOATIME is refused for files we do not own; stop asking for it
+            if e.errno != errno.EPERM or not flags & _O_NOATIME:
+                raise
+            flags &= ~_O_NOATIME
+            self._header_open_flags = flags
+            fd = os.open(file_path, flags)
+        
+        try:
+            return os.read(fd, length)
+        finally:
+            os.close(fd)
+    
     def _is_text_content(self, data: bytes) -> bool:
         """Check if content appears to be text"""
         if not data:
             return False
             
-        # allow printable ASCII, common whitespace, and UTF-8 BOMs
-        text_chars = set(range(32, 127)) | {9, 10, 13}  # tab, newline, carriage return
-        
         # check for UTF-8 BOM
         match data[:3]:
             case b'\xef\xbb\xbf':  # UTF-8 BOM
@@ -198,25 +292,32 @@ class FileSystemAnalyzer:
             case b'\xff\xfe' | b'\xfe\xff':  # UTF-16 BOMs
                 return True
             
-        # check if mostly printable characters
-        printable_count = sum(1 for byte in data if byte in text_chars)
-        return printable_count / len(data) > 0.85
-    
-    def get_file_category(self, file_path: Path) -> FileCategory:
-        """Categorize file using signatures, then extension"""
-        # try file signature first
-        if self.use_signatures:
-            signature_category = self.detect_file_signature(file_path)
-            if signature_category:
+        # check if mostly printable characters; translate and count both run in C
+        nontext_count = data.translate(_NONTEXT_TABLE).count(b'\x01')
+        return (len(data) - nontext_count) / len(data) > 0.85
+    
+    def get_file_category(self, file_path: StrPath) -> FileCategory:
+        """Categorize file by a trusted extension, else by signature, then extension"""
+        return self._categorize(file_path, _suffix(os.path.basename(file_path)))
+    
+    def _categorize(self, file_path: StrPath, suffix: str, size: Optional[int] = None) -> FileCategory:
+        """Categorize file given its already-lowercased suffix and, if known, its size"""
+        # a known extension is usually right, so only sniff the header for
+        # unknown or ambiguous ones unless every file should be checked
+        if self.use_signatures and (self.paranoid_signatures or suffix not in self._TRUSTED_EXTENSIONS):
+            signature_category = self.detect_file_signature(file_path, size)
+            if signature_category is not None:
                 return signature_category
         
         # fall back to extension
-        suffix = file_path.suffix.lower()
         return self.EXTENSION_MAP.get(suffix, FileCategory.OTHER)
     
-    def check_permissions(self, file_path: Path, file_stat: os.stat_result) -> Optional[str]:
+    def check_permissions(self, file_path: StrPath, file_stat: os.stat_result) -> Optional[str]:
         """Check for unusual file permissions"""
-        mode = file_stat.st_mode
+        return self._permission_issue(file_stat.st_mode, _suffix(os.path.basename(file_path)))
+    
+    def _permission_issue(self, mode: int, suffix: str) -> Optional[str]:
+        """Check permission bits given the file's already-lowercased suffix"""
         issues = []
         
         # world-writable files
@@ -230,34 +331,72 @@ class FileSystemAnalyzer:
             issues.append("SGID")
         
         # executable text files
-        if (mode & stat.S_IXUSR) and file_path.suffix.lower() in self.SUSPICIOUS_EXECUTABLE_EXTENSIONS:
+        if (mode & stat.S_IXUSR) and suffix in self.SUSPICIOUS_EXECUTABLE_EXTENSIONS:
             issues.append("suspicious-executable")
         
         return ", ".join(issues) if issues else None
     
-    def analyze_file(self, file_path: Path) -> Optional[FileInfo]:
+    def analyze_file(self, file_path: StrPath) -> Optional[FileInfo]:
         """Analyze a single file"""
+        file_path = os.fspath(file_path)
+        file_stat = self._stat_regular(file_path, partial(os.stat, file_path), self.errors)
+        if file_stat is None:
+            return None
+        
+        return self._build_file_info(file_path, os.path.basename(file_path), file_stat)
+    
+    def _stat_regular(
+        self, path: str, stat_call: Callable[[], os.stat_result], errors: List[Tuple[str, str]]
+    ) -> Optional[os.stat_result]:
+        """Stat path via stat_call, returning None for errors and non-regular files
+
+        stat_call is os.stat for a bare path, or DirEntry.stat to reuse the
+        entry's cached data. Failures are appended to errors, which need not
+        be self.errors.
+        """
         try:
-            file_stat = file_path.stat()
-            
-            # skip non-regular files
-            if not stat.S_ISREG(file_stat.st_mode):
-                return None
-                
-            file_size = file_stat.st_size
-            category = self.get_file_category(file_path)
-            permissions_issue = self.check_permissions(file_path, file_stat)
-            
-            return FileInfo(
-                path=file_path,
-                size=file_size,
-                category=category,
-                permissions_issue=permissions_issue
-            )
-            
+            file_stat = stat_call()
         except (OSError, PermissionError) as e:
-            self.errors.append((file_path, str(e)))
+            errors.append((path, str(e)))
+            return None
+        
+        # skip non-regular files
+        if not stat.S_ISREG(file_stat.st_mode):
             return None
+        
+        return file_stat
+    
+    def _build_file_info(self, path: str, name: str, file_stat: os.stat_result) -> FileInfo:
+        """Categorize an already-stat'ed regular file"""
+        suffix = _suffix(name)
+        return FileInfo(
+            path=path,
+            size=file_stat.st_size,
+            category=self._categorize(path, suffix, file_stat.st_size),
+            permissions_issue=self._permission_issue(file_stat.st_mode, suffix)
+        )
+    
+    def _walk(self, top: Path) -> Iterator[os.DirEntry]:
+        """Yield every non-directory entry below top, depth-first"""
+        pending = [top]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # d_type from readdir answers this without a stat; the
+                        # lstat fallback for DT_UNKNOWN can fail, and os.walk
+                        # then treats the entry as a non-directory
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            pending.append(entry.path)
+                        else:
+                            yield entry
+            except (OSError, PermissionError):
+                # skip inaccessible directories, as os.walk does
+                continue
     
     def analyze_directory(self) -> None:
         """Main analysis function"""
@@ -270,41 +409,75 @@ class FileSystemAnalyzer:
         print(f"Analyzing directory: {self.directory}")
         print("=" * 50)
         
-        # use os.walk for efficiency
-        for root, dirs, files in os.walk(self.directory):
-            root_path = Path(root)
-            
-            # filter out inaccessible directories
-            dirs[:] = [d for d in dirs if self._can_access(root_path / d)]
-            
-            for file_name in files:
-                file_path = root_path / file_name
-                file_info = self.analyze_file(file_path)
-                
-                if file_info:
-                    # update counters
-                    self.total_files += 1
-                    self.total_size += file_info.size
-                    
-                    # categorize
-                    self.files_by_category[file_info.category].append(file_info)
-                    self.category_sizes[file_info.category] += file_info.size
-                    
-                    # check for large files
-                    if file_info.size > self.size_threshold:
-                        self.large_files.append(file_info)
-                    
-                    # check for permission issues
-                    if file_info.permissions_issue:
-                        self.permission_issues.append(file_info)
-    
-    def _can_access(self, path: Path) -> bool:
-        """Check if directory can be accessed"""
-        try:
-            path.stat()
-            return True
-        except (OSError, PermissionError):
-            return False
+        # the walk yields each directory's entries contiguously, so a batch
+        # mostly covers one directory
+        batches = _batched(self._walk(self.directory), self.BATCH_SIZE)
+        
+        if self.jobs <= 1:
+            for batch in batches:
+                self._record_batch(self._analyze_batch(batch))
+            return
+        
+        # stat and header reads release the GIL, so worker threads overlap
+        # their I/O; results are merged here in walk order, without locks
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                pending.append(executor.submit(self._analyze_batch, batch))
+                # keep a bounded window of batches in flight
+                if len(pending) >= self.jobs * 2:
+                    self._record_batch(pending.popleft().result())
+            while pending:
+                self._record_batch(pending.popleft().result())
+    
+    def _analyze_batch(
+        self, entries: List[os.DirEntry]
+    ) -> Tuple[List[FileInfo], List[Tuple[str, str]]]:
+        """Analyze a batch of entries: stat them all, then read their headers
+
+        Returns the batch's file infos and errors; nothing shared is mutated,
+        so batches can run on worker threads.
+        """
+        errors: List[Tuple[str, str]] = []
+        # metadata pass first, so inode lookups for a directory run back to
+        # back instead of interleaving with the opens for signature reads
+        stats = [(entry, self._stat_regular(entry.path, entry.stat, errors)) for entry in entries]
+        file_infos = [
+            self._build_file_info(entry.path, entry.name, file_stat)
+            for entry, file_stat in stats
+            if file_stat is not None
+        ]
+        return file_infos, errors
+    
+    def _record_batch(self, batch: Tuple[List[FileInfo], List[Tuple[str, str]]]) -> None:
+        """Merge a worker's results into the totals, in walk order"""
+        file_infos, errors = batch
+        self.errors.extend(errors)
+        for file_info in file_infos:
+            self._record(file_info)
+    
+    def _record(self, file_info: FileInfo) -> None:
+        """Add one analyzed file to the totals"""
+        # update counters
+        self.total_files += 1
+        self.total_size += file_info.size
+        
+        # categorize
+        self.category_counts[file_info.category] += 1
+        self.category_sizes[file_info.category] += file_info.size
+        
+        # check for large files, keeping only the largest in memory
+        if file_info.size > self.size_threshold:
+            self.large_file_count += 1
+            entry = (file_info.size, file_info.path)
+            if len(self.large_files) < self.max_large_files:
+                heapq.heappush(self.large_files, entry)
+            elif self.large_files and entry > self.large_files[0]:
+                heapq.heapreplace(self.large_files, entry)
+        
+        # check for permission issues
+        if file_info.permissions_issue:
+            self.permission_issues.append((file_info.path, file_info.permissions_issue))
     
     @staticmethod
     def format_size(size_bytes: int) -> str:
@@ -321,76 +494,86 @@ class FileSystemAnalyzer:
     
     def generate_report(self) -> None:
         """Generate and display the analysis report"""
-        print("\n" + "=" * 50)
-        print("FILE SYSTEM ANALYSIS REPORT")
-        print("=" * 50)
+        # scanned paths all start with the directory, so strip it as a prefix
+        base = os.fspath(self.directory)
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        
+        def relative(path: str) -> str:
+            # analyze_file may have recorded errors for paths outside the tree
+            return path[len(prefix):] if path.startswith(prefix) else os.path.relpath(path, base)
+        
+        # collect the report and write it in one call rather than one per line
+        out: List[str] = []
+        
+        out.append("\n" + "=" * 50)
+        out.append("FILE SYSTEM ANALYSIS REPORT")
+        out.append("=" * 50)
         
-        print(f"\nTotal files analyzed: {self.total_files:,}")
-        print(f"Total size: {self.format_size(self.total_size)}")
+        out.append(f"\nTotal files analyzed: {self.total_files:,}")
+        out.append(f"Total size: {self.format_size(self.total_size)}")
         
         # type categorization
-        print("\nFILE TYPE CATEGORIES:")
-        print("-" * 30)
+        out.append("\nFILE TYPE CATEGORIES:")
+        out.append("-" * 30)
         
         # sort categories by total size (descending)
         sorted_categories = sorted(
-            self.files_by_category.items(),
-            key=lambda x: self.category_sizes[x[0]],
+            (category for category in FileCategory if self.category_counts[category]),
+            key=self.category_sizes.__getitem__,
             reverse=True
         )
         
-        for category, files in sorted_categories:
-            count = len(files)
+        for category in sorted_categories:
+            count = self.category_counts[category]
             size = self.category_sizes[category]
             percentage = (size / self.total_size * 100) if self.total_size > 0 else 0
-            print(f"{category.value.capitalize():<12}: {count:>6} files, "
+            out.append(f"{category.name.capitalize():<12}: {count:>6} files, "
                   f"{self.format_size(size):>10} ({percentage:>5.1f}%)")
         
         # large files report
-        print(f"\nLARGE FILES (> {self.format_size(self.size_threshold)}):")
-        print("-" * 50)
-        if self.large_files:
-            # sort by size, largest first
-            self.large_files.sort(key=lambda x: x.size, reverse=True)
-            for file_info in self.large_files[:self.max_large_files]:
-                rel_path = file_info.path.relative_to(self.directory)
-                print(f"{self.format_size(file_info.size):>10}  {rel_path}")
+        out.append(f"\nLARGE FILES (> {self.format_size(self.size_threshold)}):")
+        out.append("-" * 50)
+        if self.large_file_count:
+            # largest first; O(N log K) even if large_files holds more than K
+            top = heapq.nlargest(self.max_large_files, self.large_files)
+            for size, path in top:
+                out.append(f"{self.format_size(size):>10}  {relative(path)}")
             
-            if len(self.large_files) > self.max_large_files:
-                print(f"\n... and {len(self.large_files) - self.max_large_files} more large files")
+            if self.large_file_count > len(top):
+                out.append(f"\n... and {self.large_file_count - len(top)} more large files")
         else:
-            print("No large files found")
+            out.append("No large files found")
         
         # permission issues report
-        print("\nPERMISSION ISSUES:")
-        print("-" * 30)
+        out.append("\nPERMISSION ISSUES:")
+        out.append("-" * 30)
         if self.permission_issues:
             # group by issue type
-            issues_by_type = defaultdict(list)
-            for file_info in self.permission_issues:
-                if file_info.permissions_issue:
-                    issues_by_type[file_info.permissions_issue].append(file_info)
+            issues_by_type: Dict[str, List[str]] = defaultdict(list)
+            for path, issue in self.permission_issues:
+                issues_by_type[issue].append(path)
             
             for issue_type, files in sorted(issues_by_type.items()):
-                print(f"\n{issue_type}:")
-                for file_info in files[:5]:
-                    rel_path = file_info.path.relative_to(self.directory)
-                    print(f"  {rel_path}")
+                out.append(f"\n{issue_type}:")
+                for path in files[:5]:
+                    out.append(f"  {relative(path)}")
                 if len(files) > 5:
-                    print(f"  ... and {len(files) - 5} more")
+                    out.append(f"  ... and {len(files) - 5} more")
         else:
-            print("No files with unusual permissions found")
+            out.append("No files with unusual permissions found")
         
         # errors report
         if self.errors:
-            print("\nERRORS ENCOUNTERED:")
-            print("-" * 30)
+            out.append("\nERRORS ENCOUNTERED:")
+            out.append("-" * 30)
             for path, error in self.errors[:10]:
-                rel_path = path.relative_to(self.directory)
-                print(f"  {rel_path}: {error}")
+                out.append(f"  {relative(path)}: {error}")
             if len(self.errors) > 10:
-                print(f"  ... and {len(self.errors) - 10} more errors")
+                out.append(f"  ... and {len(self.errors) - 10} more errors")
+        
+        sys.stdout.write("\n".join(out) + "\n")
 
+@lru_cache(maxsize=128)
 def parse_size(size_str: str) -> int:
     """Parse human-readable size string to bytes"""
     size_str = size_str.strip().upper()
@@ -421,8 +604,8 @@ def parse_size(size_str: str) -> int:
     except ValueError:
         raise ValueError(f"Invalid size format: '{size_str}'")
 
-def main() -> None:
-    """Main entry point"""
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point; argv defaults to sys.argv[1:]"""
     parser = argparse.ArgumentParser(
         description="Analyze file system structure and usage",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -433,6 +616,8 @@ Examples:
   %(prog)s . -s 1G                         # Analyze current directory, 1GB threshold
   %(prog)s /data --no-signatures           # Fast scan without file signature detection
   %(prog)s . --max-large-files 25          # Show top 25 large files instead of 10
+  %(prog)s /srv --jobs 1                   # Single-threaded scan
+  %(prog)s /mnt --paranoid-signatures      # Check signatures even for known extensions
         """
     )
     
@@ -453,6 +638,12 @@ Examples:
         help='Disable file signature detection for faster processing (extension-based only)'
     )
     
+    parser.add_argument(
+        '--paranoid-signatures',
+        action='store_true',
+        help='Check file signatures even when the extension is known (slower, catches mislabelled files)'
+    )
+    
     parser.add_argument(
         '--max-large-files',
         type=int,
@@ -460,7 +651,17 @@ Examples:
         help='Maximum number of large files to display in report. Default: 10'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f'Number of worker threads for stat and signature reads. Default: {DEFAULT_JOBS}'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
     
     # parse size threshold
     try:
@@ -475,7 +676,9 @@ Examples:
             args.directory, 
             size_threshold, 
             use_signatures=not args.no_signatures,
-            max_large_files=args.max_large_files
+            max_large_files=args.max_large_files,
+            jobs=args.jobs,
+            paranoid_signatures=args.paranoid_signatures
         )
         analyzer.analyze_directory()
         analyzer.generate_report()